@@ -14,6 +14,12 @@ from .message import Message
 from .widget import Reactive, Widget
 
 
+_BACK_COLOR = Color.parse("#555555")
+_BACK_COLOR_INACTIVE = Color.parse("#444444")
+_BAR_COLOR = Color.parse("bright_magenta")
+_BAR_COLOR_GRABBED = Color.parse("bright_yellow")
+
+
 @rich.repr.auto
 class ScrollUp(Message):
     """Message sent when clicking above handle."""
@@ -76,8 +82,8 @@ class ScrollBarRender:
         ascii_only: bool = False,
         thickness: int = 1,
         vertical: bool = True,
-        back_color: Color = Color.parse("#555555"),
-        bar_color: Color = Color.parse("bright_magenta"),
+        back_color: Color = _BACK_COLOR,
+        bar_color: Color = _BAR_COLOR,
     ) -> Segments:
 
         if vertical:
@@ -167,8 +173,8 @@ class ScrollBarRender:
             position=self.position,
             vertical=self.vertical,
             thickness=thickness,
-            back_color=_style.bgcolor or Color.parse("#555555"),
-            bar_color=_style.color or Color.parse("bright_magenta"),
+            back_color=_style.bgcolor or _BACK_COLOR,
+            bar_color=_style.color or _BAR_COLOR,
         )
         yield bar
 
@@ -193,8 +199,8 @@ class ScrollBar(Widget):
 
     def render(self) -> RenderableType:
         style = Style(
-            bgcolor=(Color.parse("#555555" if self.mouse_over else "#444444")),
-            color=Color.parse("bright_yellow" if self.grabbed else "bright_magenta"),
+            bgcolor=_BACK_COLOR if self.mouse_over else _BACK_COLOR_INACTIVE,
+            color=_BAR_COLOR_GRABBED if self.grabbed else _BAR_COLOR,
         )
         return ScrollBarRender(
             virtual_size=self.virtual_size,